@@ -1,364 +1,515 @@
 import streamlit as st
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from PIL import Image
-import cv2
-
-class MarineEcosystemAnalyzer:
-    def __init__(self):
-        """
-        Initialize advanced marine ecosystem analysis capabilities
-        """
-        # Pre-trained model placeholders (in a real-world scenario, these would be actual ML models)
-        self.plastic_detection_model = self._load_plastic_detection_model()
-        self.coral_health_model = self._load_coral_health_model()
-        self.oil_spill_detection_model = self._load_oil_spill_model()
-        self.hab_prediction_model = self._load_hab_model()
-
-    def _load_plastic_detection_model(self):
-        """
-        Simulate a sophisticated plastic detection model
-        Returns a dictionary of plastic type detection probabilities
-        """
-        return {
-            'Microplastics': {'detection_weight': 0.3, 'ecological_impact': 0.8},
-            'Fishing Nets': {'detection_weight': 0.2, 'ecological_impact': 0.7},
-            'Plastic Bottles': {'detection_weight': 0.25, 'ecological_impact': 0.6},
-            'Industrial Plastic Waste': {'detection_weight': 0.15, 'ecological_impact': 0.9}
-        }
 
-    def _load_coral_health_model(self):
-        """
-        Simulate an advanced coral health assessment model
-        """
-        return {
-            'Healthy Coral': {'weight': 0.4, 'recovery_potential': 0.9},
-            'Early Bleaching': {'weight': 0.3, 'recovery_potential': 0.6},
-            'Advanced Bleaching': {'weight': 0.2, 'recovery_potential': 0.2},
-            'Coral Disease': {'weight': 0.1, 'recovery_potential': 0.1}
-        }
+# Static page content, rendered with a single st.markdown call per section
+_HOME_HTML = """
+### 🌊 Protecting Our Oceans Together
+
+Marine Ecosystem Guardian is an advanced monitoring and analysis platform designed to help protect our ocean ecosystems. 
+Our tools provide real-time insights into various marine environmental challenges.
+
+#### Key Features:
+1. 🔍 **Real-time Analysis** of marine environmental conditions
+2. 📊 **Data Visualization** for better understanding
+3. 🎯 **Actionable Insights** for conservation
+4. 🤝 **Community Engagement** in marine protection
+
+#### Why It Matters:
+- Ocean health directly impacts global climate
+- Marine biodiversity is crucial for ecosystem balance
+- Human activities significantly affect marine environments
+"""
+
+_PREVENTION_HTML = """
+# 🛡️ Marine Protection Guidelines
+
+<style>
+.main-title {
+    font-size: 32px;
+    color: #ffffff;
+    font-weight: 700;
+    margin-bottom: 30px;
+}
+.section-title {
+    font-size: 28px;
+    color: #f0f0f0;
+    font-weight: 600;
+    margin: 25px 0 15px 0;
+}
+.subsection-title {
+    font-size: 22px;
+    color: #e0e0e0;
+    font-weight: 500;
+    margin: 20px 0 10px 0;
+}
+.list-items {
+    font-size: 18px;
+    color: #d0d0d0;
+    line-height: 2;
+    margin-left: 25px;
+}
+</style>
+
+<p class="section-title">Individual Actions</p>
+"""
+
+_DAILY_HABITS_HTML = """
+<p class="subsection-title">Daily Habits</p>
+<div class="list-items">
+• Reduce single-use plastics<br>
+• Choose sustainable seafood<br>
+• Use reef-safe sunscreen<br>
+• Properly dispose of waste
+</div>
+"""
+
+_ACTIVE_PARTICIPATION_HTML = """
+<p class="subsection-title">Active Participation</p>
+<div class="list-items">
+• Join beach cleanup events<br>
+• Support marine conservation groups<br>
+• Report marine pollution incidents<br>
+• Share awareness on social media
+</div>
+"""
+
+_CALL_TO_ACTION_HTML = """
+<div style="background-color: #f0f8ff; padding: 20px; border-radius: 10px; margin-top: 30px;">
+<p class="section-title" style="color: #1e90ff;">🎯 Take Action Today</p>
+<p style="font-size: 18px;">
+Join the global movement to protect our oceans. Start with small changes in your daily life 
+and become part of the solution. Remember, every action counts!
+</p>
+</div>
+
+<p class="section-title">🔗 Useful Links</p>
+"""
+
+_ABOUT_HTML = """
+### About Marine Ecosystem Guardian
+
+This project combines advanced analytics with environmental science to protect our oceans.
+
+#### Technology Stack:
+- Image Analysis
+- Real-time Monitoring
+- Data Visualization
+- Predictive Analytics
+
+#### Future Developments:
+- Artificial Intelligence Integration
+- Mobile Application
+- Community Features
+- Global Data Integration
+"""
+
+# Fixed callout text for the analysis panels
+_STR_PLASTIC_ACTIONS = """
+• Reduce single-use plastics
+• Support local recycling programs
+• Choose sustainable alternatives
+"""
+
+_STR_CORAL_STRESS = ("Key Stress Factors:\n"
+                     "• Ocean temperature\n"
+                     "• Water acidity\n"
+                     "• Environmental pollution")
+
+_STR_OIL_EFFECTS = ("Critical Effects:\n"
+                    "• Marine habitat damage\n"
+                    "• Ecosystem disruption\n"
+                    "• Biodiversity impact")
+
+_STR_HAB_CONCERNS = ("Primary Concerns:\n"
+                     "• Water quality degradation\n"
+                     "• Marine life stress\n"
+                     "• Ecosystem imbalance")
+
+_STR_CRITICAL_ACTIONS = "Critical Actions Required:"
+_CRITICAL_ACTIONS_MD = """
+• Implement immediate water quality improvement measures
+
+• Establish protected marine zones
+
+• Reduce industrial discharge
+
+• Monitor species population regularly
+"""
+
+_STR_PREVENTIVE_MEASURES = "Preventive Measures:"
+_PREVENTIVE_MEASURES_MD = """
+• Continue regular ecosystem monitoring
+
+• Maintain sustainable fishing practices
+
+• Support marine conservation programs
+
+• Engage in community education
+"""
+
+# Icons shown next to each species trend in the ecosystem health panel
+_TREND_ICON = {'critical': "🔴", 'declining': "⚠️", 'stable': "✅"}
+
+# Impact score buckets: a score above _IMPACT_THRESHOLDS[i - 1] and at most
+# _IMPACT_THRESHOLDS[i] is described by _IMPACT_TEXT[i]
+_IMPACT_THRESHOLDS = np.array([0.4, 0.6, 0.8])
+_IMPACT_TEXT = (
+    "Lower impact but monitoring required",
+    "Moderate environmental concern",
+    "Significant impact on marine life",
+    "Severe impact requiring immediate attention"
+)
+
+def _load_plastic_detection_model():
+    """
+    Simulate a sophisticated plastic detection model
+    Returns parallel arrays of plastic type detection probabilities and impacts
+    """
+    return {
+        'categories': ('Microplastics', 'Fishing Nets', 'Plastic Bottles', 'Industrial Plastic Waste'),
+        'detection_weight': np.array([0.3, 0.2, 0.25, 0.15]),
+        'ecological_impact': np.array([0.8, 0.7, 0.6, 0.9])
+    }
 
-    def _load_oil_spill_model(self):
-        """
-        Simulate an oil spill detection and impact assessment model
-        """
-        return {
-            'Severity Levels': {
-                'Minor Spill': {'detection_weight': 0.4, 'ecological_impact': 0.3},
-                'Moderate Spill': {'detection_weight': 0.3, 'ecological_impact': 0.6},
-                'Major Spill': {'detection_weight': 0.2, 'ecological_impact': 0.9},
-                'Catastrophic Spill': {'detection_weight': 0.1, 'ecological_impact': 1.0}
-            }
-        }
+def _load_coral_health_model():
+    """
+    Simulate an advanced coral health assessment model
+    """
+    return {
+        'categories': ('Healthy Coral', 'Early Bleaching', 'Advanced Bleaching', 'Coral Disease'),
+        'weight': np.array([0.4, 0.3, 0.2, 0.1]),
+        'recovery_potential': np.array([0.9, 0.6, 0.2, 0.1])
+    }
 
-    def _load_hab_model(self):
-        """
-        Simulate a comprehensive HAB prediction model
-        """
-        return {
-            'Risk Factors': {
-                'Water Temperature': {'sensitivity': 0.3},
-                'Nutrient Levels': {'sensitivity': 0.3},
-                'Salinity': {'sensitivity': 0.2},
-                'pH Levels': {'sensitivity': 0.2}
-            }
-        }
+def _load_oil_spill_model():
+    """
+    Simulate an oil spill detection and impact assessment model
+    """
+    return {
+        'levels': ('Minor Spill', 'Moderate Spill', 'Major Spill', 'Catastrophic Spill'),
+        'detection_weight': np.array([0.4, 0.3, 0.2, 0.1]),
+        'ecological_impact': np.array([0.3, 0.6, 0.9, 1.0])
+    }
 
-    def _load_biodiversity_model(self):
-        """
-        Simulate a marine biodiversity and water quality assessment model
-        """
-        return {
-            'Species Diversity': {
-                'Fish': {'health_index': 0.7, 'trend': 'declining'},
-                'Mammals': {'health_index': 0.6, 'trend': 'stable'},
-                'Invertebrates': {'health_index': 0.5, 'trend': 'declining'},
-                'Plant Life': {'health_index': 0.4, 'trend': 'critical'}
-            },
-            'Water Quality': {
-                'Dissolved Oxygen': {'optimal_range': (6.5, 8.5), 'importance': 0.3},
-                'Turbidity': {'optimal_range': (0, 5), 'importance': 0.2},
-                'Microplastic Count': {'optimal_range': (0, 10), 'importance': 0.3},
-                'Chemical Pollutants': {'optimal_range': (0, 2), 'importance': 0.2}
-            }
+def _load_hab_model():
+    """
+    Simulate a comprehensive HAB prediction model
+    """
+    return {
+        'factors': ('Water Temperature', 'Nutrient Levels', 'Salinity', 'pH Levels'),
+        'sensitivity': np.array([0.3, 0.3, 0.2, 0.2])
+    }
+
+def _load_biodiversity_model():
+    """
+    Simulate a marine biodiversity and water quality assessment model
+    """
+    return {
+        'Species Diversity': {
+            'species': ('Fish', 'Mammals', 'Invertebrates', 'Plant Life'),
+            'health_index': np.array([0.7, 0.6, 0.5, 0.4]),
+            'trend': ('declining', 'stable', 'declining', 'critical')
+        },
+        'Water Quality': {
+            'parameters': ('Dissolved Oxygen', 'Turbidity', 'Microplastic Count', 'Chemical Pollutants'),
+            'optimal_min': np.array([6.5, 0.0, 0.0, 0.0]),
+            'optimal_max': np.array([8.5, 5.0, 10.0, 2.0]),
+            'importance': np.array([0.3, 0.2, 0.3, 0.2])
         }
+    }
 
-    def analyze_plastic_waste(self, uploaded_image):
-        """
-        Perform detailed plastic waste analysis
-        """
-        st.subheader("Plastic Waste Analysis")
-        
-        st.markdown("""
-        <small>This analysis shows the distribution of different types of plastic waste 
-        and their ecological impact on marine environments.</small>
-        """, unsafe_allow_html=True)
-        
-        # Create tabs for different aspects of analysis
-        tab1, tab2 = st.tabs(["Distribution Analysis", "Impact Assessment"])
-        
-        with tab1:
-            st.markdown("##### Distribution of Plastic Types")
-            # Main visualization
-            plt.figure(figsize=(8, 4))
-            categories = list(self.plastic_detection_model.keys())
-            probabilities = [self.plastic_detection_model[cat]['detection_weight'] for cat in categories]
-            
-            plt.bar(categories, probabilities)
-            plt.title("Plastic Distribution by Type")
-            plt.xlabel("Categories")
-            plt.ylabel("Detection Probability")
-            plt.xticks(rotation=45)
-            plt.tight_layout()
-            st.pyplot(plt)
-        
-        with tab2:
-            st.markdown("##### Environmental Impact")
-            # Key findings with explanations
-            for category, details in self.plastic_detection_model.items():
-                impact = details['ecological_impact']
-                st.markdown(f"""
-                **{category}**
-                <small>Impact Score: {impact*100:.1f}% - 
-                {self._get_impact_description(impact)}</small>
-                """, unsafe_allow_html=True)
-        
-        # Recommendations
-        st.markdown("#### 📋 Recommended Actions")
-        st.info("""
-        • Reduce single-use plastics
-        • Support local recycling programs
-        • Choose sustainable alternatives
-        """)
+def _get_impact_descriptions(impacts):
+    """Helper to provide impact descriptions for an array of impact scores"""
+    return tuple(_IMPACT_TEXT[i] for i in np.searchsorted(_IMPACT_THRESHOLDS, impacts, side='left'))
+
+# Pre-trained model placeholders (in a real-world scenario, these would be actual ML models)
+PLASTIC_MODEL = _load_plastic_detection_model()
+CORAL_MODEL = _load_coral_health_model()
+OIL_MODEL = _load_oil_spill_model()
+HAB_MODEL = _load_hab_model()
+BIODIV_MODEL = _load_biodiversity_model()
+
+# Short aliases for the model arrays used on every rerun
+_PLASTIC_CATS = PLASTIC_MODEL['categories']
+_PLASTIC_WEIGHTS = PLASTIC_MODEL['detection_weight']
+_PLASTIC_IMPACTS = PLASTIC_MODEL['ecological_impact']
+_PLASTIC_IMPACT_TEXT = _get_impact_descriptions(_PLASTIC_IMPACTS)
+
+_CORAL_CATS = CORAL_MODEL['categories']
+_CORAL_WEIGHTS = CORAL_MODEL['weight']
+_CORAL_RECOVERY = CORAL_MODEL['recovery_potential']
+_CORAL_RECOVERY_MD = "\n\n".join(
+    f"**{category}**: {recovery*100:.1f}%"
+    for category, recovery in zip(_CORAL_CATS, _CORAL_RECOVERY)
+)
+
+_OIL_LEVELS = OIL_MODEL['levels']
+_OIL_WEIGHTS = OIL_MODEL['detection_weight']
+_OIL_IMPACTS = OIL_MODEL['ecological_impact']
+_OIL_IMPACT_MD = "\n\n".join(
+    f"**{level}**: {impact*100:.1f}% impact severity"
+    for level, impact in zip(_OIL_LEVELS, _OIL_IMPACTS)
+)
+
+_SPECIES_CATS = BIODIV_MODEL['Species Diversity']['species']
+_SPECIES_HEALTH = BIODIV_MODEL['Species Diversity']['health_index']
+_AVG_SPECIES_HEALTH = float(_SPECIES_HEALTH.mean())
+_SPECIES_COLORS = tuple(np.where(_SPECIES_HEALTH > 0.6, 'green',
+                                 np.where(_SPECIES_HEALTH > 0.4, 'yellow', 'red')).tolist())
+_SPECIES_TREND_LABELS = [
+    (name, _TREND_ICON[trend], trend.title())
+    for name, trend in zip(_SPECIES_CATS, BIODIV_MODEL['Species Diversity']['trend'])
+]
+_SPECIES_TRENDS_MD = "\n\n".join(
+    f"{trend_icon} **{species}**: {trend_label}"
+    for species, trend_icon, trend_label in _SPECIES_TREND_LABELS
+)
+
+# HAB sensitivities, ordered as marine_kernels.hab_risk expects
+_HAB_SENS = HAB_MODEL['sensitivity']
+
+# HAB risk buckets, same boundary convention as _IMPACT_THRESHOLDS
+_HAB_RISK_THRESHOLDS = np.array([0.4, 0.6, 0.8])
+_HAB_RISK_LEVELS = ("Low", "Moderate", "High", "Critical")
+
+# Water quality bounds and weights, ordered as _calculate_water_quality's arguments
+_WQ_MINS = BIODIV_MODEL['Water Quality']['optimal_min']
+_WQ_MAXS = BIODIV_MODEL['Water Quality']['optimal_max']
+_WQ_WEIGHTS = BIODIV_MODEL['Water Quality']['importance']
+
+def analyze_plastic_waste(uploaded_image):
+    """
+    Perform detailed plastic waste analysis
+    """
+    st.subheader("Plastic Waste Analysis")
 
-    def _get_impact_description(self, impact):
-        """Helper method to provide impact descriptions"""
-        if impact > 0.8:
-            return "Severe impact requiring immediate attention"
-        elif impact > 0.6:
-            return "Significant impact on marine life"
-        elif impact > 0.4:
-            return "Moderate environmental concern"
-        else:
-            return "Lower impact but monitoring required"
-
-    def analyze_coral_health(self, uploaded_image):
-        """
-        Coral reef health assessment
-        """
-        st.subheader("Coral Reef Health Assessment")
-        
-        # Main health status visualization
-        plt.figure(figsize=(10, 6))
-        categories = list(self.coral_health_model.keys())
-        weights = [self.coral_health_model[cat]['weight'] for cat in categories]
-        
-        plt.pie(weights, labels=categories, autopct='%1.1f%%')
-        plt.title("Coral Health Distribution")
-        st.pyplot(plt)
-        
-        # Key health indicators
-        st.write("#### Recovery Potential")
-        for category, details in self.coral_health_model.items():
-            st.write(f"**{category}**: {details['recovery_potential']*100:.1f}%")
-        
-        st.info("Key Stress Factors:\n"
-                "• Ocean temperature\n"
-                "• Water acidity\n"
-                "• Environmental pollution")
-
-    def analyze_oil_spill(self, uploaded_image):
-        """
-        Oil Spill Analysis
-        """
-        st.subheader("Oil Spill Impact Assessment")
-        
-        # Main severity visualization
-        plt.figure(figsize=(10, 6))
-        severity_levels = list(self.oil_spill_detection_model['Severity Levels'].keys())
-        detection_weights = [
-            self.oil_spill_detection_model['Severity Levels'][level]['detection_weight'] 
-            for level in severity_levels
-        ]
-        
-        plt.bar(severity_levels, detection_weights)
-        plt.title("Spill Severity Analysis")
-        plt.xlabel("Severity Level")
-        plt.ylabel("Detection Probability")
-        plt.xticks(rotation=45)
-        st.pyplot(plt)
-        
-        # Impact summary
-        st.write("#### Ecological Impact")
-        for level, details in self.oil_spill_detection_model['Severity Levels'].items():
-            st.write(f"**{level}**: {details['ecological_impact']*100:.1f}% impact severity")
-        
-        st.error("Critical Effects:\n"
-                 "• Marine habitat damage\n"
-                 "• Ecosystem disruption\n"
-                 "• Biodiversity impact")
-
-    def analyze_harmful_algal_bloom(self):
-        """
-        HAB risk assessment
-        """
-        st.subheader("Harmful Algal Bloom Risk Assessment")
-        
-        # Environmental inputs
-        st.write("#### Environmental Parameters")
-        water_temp = st.slider("Water Temperature (°C)", 20.0, 35.0, 25.0)
-        nutrient_levels = st.slider("Nutrient Levels", 0.0, 10.0, 2.0)
-        salinity = st.slider("Salinity", 30.0, 40.0, 35.0)
-        ph_level = st.slider("pH Level", 6.0, 9.0, 8.0)
-        
-        # Risk calculation
-        risk_factors = self.hab_prediction_model['Risk Factors']
-        hab_risk_score = (
-            risk_factors['Water Temperature']['sensitivity'] * (water_temp / 35) +
-            risk_factors['Nutrient Levels']['sensitivity'] * (nutrient_levels / 10) +
-            risk_factors['Salinity']['sensitivity'] * (1 - abs(salinity - 35) / 10) +
-            risk_factors['pH Levels']['sensitivity'] * (1 - abs(ph_level - 8) / 2)
-        )
-        
-        # Risk assessment
-        risk_category = (
-            "Critical" if hab_risk_score > 0.8 else 
-            "High" if hab_risk_score > 0.6 else 
-            "Moderate" if hab_risk_score > 0.4 else 
-            "Low"
-        )
-        
-        st.metric("Risk Level", risk_category)
-        st.metric("Risk Score", f"{hab_risk_score*100:.1f}%")
-        
-        st.warning("Primary Concerns:\n"
-                  "• Water quality degradation\n"
-                  "• Marine life stress\n"
-                  "• Ecosystem imbalance")
-
-    def analyze_marine_health(self):
-        """
-        Comprehensive marine ecosystem health analysis
-        """
-        st.subheader("Marine Ecosystem Health Monitor")
-        
-        # Initialize biodiversity model if not exists
-        if not hasattr(self, 'biodiversity_model'):
-            self.biodiversity_model = self._load_biodiversity_model()
-
-        # Water Quality Parameters Input
-        st.write("#### Water Quality Parameters")
-        dissolved_oxygen = st.slider("Dissolved Oxygen (mg/L)", 0.0, 10.0, 7.0)
-        turbidity = st.slider("Turbidity (NTU)", 0.0, 20.0, 3.0)
-        microplastic = st.slider("Microplastic Concentration (particles/L)", 0.0, 50.0, 5.0)
-        chemical_pollution = st.slider("Chemical Pollutant Index", 0.0, 10.0, 1.0)
-
-        # Calculate overall water quality score
-        water_quality = self._calculate_water_quality(
-            dissolved_oxygen, turbidity, microplastic, chemical_pollution
-        )
-
-        # Display Species Health Status
-        st.write("#### Marine Species Health Status")
-        species_data = self.biodiversity_model['Species Diversity']
-        
-        # Create health status visualization with smaller, more appropriate size
-        plt.figure(figsize=(8, 4))  # Reduced from (10, 6) to (8, 4)
-        categories = list(species_data.keys())
-        health_indices = [species_data[cat]['health_index'] for cat in categories]
-        
-        colors = ['green' if idx > 0.6 else 'yellow' if idx > 0.4 else 'red' 
-                 for idx in health_indices]
-        
-        # Create a more compact bar plot
-        bars = plt.bar(categories, health_indices, color=colors)
-        plt.title("Marine Species Health Index", pad=10)
-        plt.ylabel("Health Score")
-        plt.ylim(0, 1)
-        plt.xticks(rotation=30, ha='right')  # Angled labels for better readability
-        
-        # Add value labels on top of bars
-        for bar in bars:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.2f}',
-                    ha='center', va='bottom')
-        
-        plt.tight_layout()  # Adjust layout to prevent label cutoff
-        st.pyplot(plt)
+    st.markdown("""
+    <small>This analysis shows the distribution of different types of plastic waste 
+    and their ecological impact on marine environments.</small>
+    """, unsafe_allow_html=True)
 
-        # Display trend indicators and recommendations
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.write("#### Ecosystem Trends")
-            for species, data in species_data.items():
-                trend_icon = "🔴" if data['trend'] == 'critical' else "⚠️" if data['trend'] == 'declining' else "✅"
-                st.write(f"{trend_icon} **{species}**: {data['trend'].title()}")
-
-        with col2:
-            st.write("#### Water Quality Score")
-            quality_color = "green" if water_quality > 0.7 else "orange" if water_quality > 0.4 else "red"
-            st.markdown(f"<h1 style='color: {quality_color}'>{water_quality:.1%}</h1>", unsafe_allow_html=True)
-
-        # Conservation Recommendations
-        st.write("#### Conservation Actions")
-        self._display_conservation_recommendations(water_quality, health_indices)
-
-    def _calculate_water_quality(self, oxygen, turbidity, microplastic, chemical):
-        """
-        Calculate overall water quality score
-        """
-        quality_model = self.biodiversity_model['Water Quality']
-        
-        # Calculate individual parameter scores
-        oxygen_score = self._calculate_parameter_score(
-            oxygen, quality_model['Dissolved Oxygen']['optimal_range'])
-        turbidity_score = self._calculate_parameter_score(
-            turbidity, quality_model['Turbidity']['optimal_range'])
-        microplastic_score = self._calculate_parameter_score(
-            microplastic, quality_model['Microplastic Count']['optimal_range'])
-        chemical_score = self._calculate_parameter_score(
-            chemical, quality_model['Chemical Pollutants']['optimal_range'])
-        
-        # Weighted average
-        return (oxygen_score * 0.3 + 
-                turbidity_score * 0.2 + 
-                microplastic_score * 0.3 + 
-                chemical_score * 0.2)
-
-    def _calculate_parameter_score(self, value, optimal_range):
-        """
-        Calculate score for individual water quality parameters
-        """
-        min_val, max_val = optimal_range
-        if min_val <= value <= max_val:
-            return 1.0
-        elif value < min_val:
-            return max(0, 1 - (min_val - value) / min_val)
-        else:
-            return max(0, 1 - (value - max_val) / max_val)
-
-    def _display_conservation_recommendations(self, water_quality, species_health):
-        """
-        Display targeted conservation recommendations
-        """
-        avg_species_health = sum(species_health) / len(species_health)
-        
-        if water_quality < 0.5 or avg_species_health < 0.5:
-            st.error("Critical Actions Required:")
-            st.write("• Implement immediate water quality improvement measures")
-            st.write("• Establish protected marine zones")
-            st.write("• Reduce industrial discharge")
-            st.write("• Monitor species population regularly")
-        else:
-            st.success("Preventive Measures:")
-            st.write("• Continue regular ecosystem monitoring")
-            st.write("• Maintain sustainable fishing practices")
-            st.write("• Support marine conservation programs")
-            st.write("• Engage in community education")
+    # Create tabs for different aspects of analysis
+    tab1, tab2 = st.tabs(["Distribution Analysis", "Impact Assessment"])
+
+    with tab1:
+        st.markdown("##### Distribution of Plastic Types")
+        # Main visualization
+        st.altair_chart(
+            _category_bar_chart(_PLASTIC_CATS, _PLASTIC_WEIGHTS, "Plastic Distribution by Type",
+                                "Categories", "Detection Probability"),
+            use_container_width=True)
+
+    with tab2:
+        st.markdown("##### Environmental Impact")
+        # Key findings with explanations
+        for category, impact, description in zip(_PLASTIC_CATS, _PLASTIC_IMPACTS, _PLASTIC_IMPACT_TEXT):
+            st.markdown(f"""
+            **{category}**
+            <small>Impact Score: {impact*100:.1f}% - 
+            {description}</small>
+            """, unsafe_allow_html=True)
+
+    # Recommendations
+    st.markdown("#### 📋 Recommended Actions")
+    st.info(_STR_PLASTIC_ACTIONS)
+
+def analyze_coral_health(uploaded_image):
+    """
+    Coral reef health assessment
+    """
+    st.subheader("Coral Reef Health Assessment")
+
+    # Main health status visualization
+    st.image(_coral_pie_png(_CORAL_CATS, _CORAL_WEIGHTS))
+
+    # Key health indicators
+    st.write("#### Recovery Potential")
+    st.markdown(_CORAL_RECOVERY_MD)
+
+    st.info(_STR_CORAL_STRESS)
+
+def analyze_oil_spill(uploaded_image):
+    """
+    Oil Spill Analysis
+    """
+    st.subheader("Oil Spill Impact Assessment")
+
+    # Main severity visualization
+    st.altair_chart(
+        _category_bar_chart(_OIL_LEVELS, _OIL_WEIGHTS, "Spill Severity Analysis",
+                            "Severity Level", "Detection Probability"),
+        use_container_width=True)
+
+    # Impact summary
+    st.write("#### Ecological Impact")
+    st.markdown(_OIL_IMPACT_MD)
+
+    st.error(_STR_OIL_EFFECTS)
+
+def analyze_harmful_algal_bloom():
+    """
+    HAB risk assessment
+    """
+    st.subheader("Harmful Algal Bloom Risk Assessment")
+
+    # Environmental inputs
+    st.write("#### Environmental Parameters")
+    water_temp = st.slider("Water Temperature (°C)", 20.0, 35.0, 25.0)
+    nutrient_levels = st.slider("Nutrient Levels", 0.0, 10.0, 2.0)
+    salinity = st.slider("Salinity", 30.0, 40.0, 35.0)
+    ph_level = st.slider("pH Level", 6.0, 9.0, 8.0)
+
+    # Risk calculation (compiled kernel, imported on first use)
+    from marine_kernels import hab_risk
+    hab_risk_score = hab_risk(water_temp, nutrient_levels, salinity, ph_level, _HAB_SENS)
+
+    # Risk assessment
+    risk_category = _HAB_RISK_LEVELS[
+        int(np.searchsorted(_HAB_RISK_THRESHOLDS, hab_risk_score, side='left'))]
+
+    st.metric("Risk Level", risk_category)
+    st.metric("Risk Score", f"{hab_risk_score*100:.1f}%")
+
+    st.warning(_STR_HAB_CONCERNS)
+
+def analyze_marine_health():
+    """
+    Comprehensive marine ecosystem health analysis
+    """
+    st.subheader("Marine Ecosystem Health Monitor")
+
+    # Water Quality Parameters Input
+    st.write("#### Water Quality Parameters")
+    dissolved_oxygen = st.slider("Dissolved Oxygen (mg/L)", 0.0, 10.0, 7.0)
+    turbidity = st.slider("Turbidity (NTU)", 0.0, 20.0, 3.0)
+    microplastic = st.slider("Microplastic Concentration (particles/L)", 0.0, 50.0, 5.0)
+    chemical_pollution = st.slider("Chemical Pollutant Index", 0.0, 10.0, 1.0)
+
+    # Calculate overall water quality score
+    water_quality = _calculate_water_quality(
+        dissolved_oxygen, turbidity, microplastic, chemical_pollution
+    )
+
+    # Display Species Health Status
+    st.write("#### Marine Species Health Status")
+
+    # Create health status visualization with smaller, more appropriate size
+    st.altair_chart(
+        _species_health_chart(_SPECIES_CATS, _SPECIES_HEALTH, _SPECIES_COLORS),
+        use_container_width=True)
+
+    # Display trend indicators and recommendations
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.write("#### Ecosystem Trends")
+        st.markdown(_SPECIES_TRENDS_MD)
+
+    with col2:
+        st.write("#### Water Quality Score")
+        quality_color = "green" if water_quality > 0.7 else "orange" if water_quality > 0.4 else "red"
+        st.markdown(f"<h1 style='color: {quality_color}'>{water_quality:.1%}</h1>", unsafe_allow_html=True)
+
+    # Conservation Recommendations
+    st.write("#### Conservation Actions")
+    _display_conservation_recommendations(water_quality)
+
+def _calculate_water_quality(oxygen, turbidity, microplastic, chemical):
+    """
+    Calculate overall water quality score
+    """
+    from marine_kernels import param_score
+    values = np.array([oxygen, turbidity, microplastic, chemical], dtype=np.float64)
+    # Weighted average of the per-parameter scores
+    return float(param_score(values, _WQ_MINS, _WQ_MAXS) @ _WQ_WEIGHTS)
+
+def _display_conservation_recommendations(water_quality):
+    """
+    Display targeted conservation recommendations
+    """
+    if water_quality < 0.5 or _AVG_SPECIES_HEALTH < 0.5:
+        st.error(_STR_CRITICAL_ACTIONS)
+        st.markdown(_CRITICAL_ACTIONS_MD)
+    else:
+        st.success(_STR_PREVENTIVE_MEASURES)
+        st.markdown(_PREVENTIVE_MEASURES_MD)
+
+@st.cache_data
+def _coral_pie_png(categories, weights):
+    """
+    Pie chart of coral health distribution, rendered to PNG bytes so cache
+    hits skip both figure construction and Agg rasterization
+    """
+    import io
+    # Imported here so pages without charts never load matplotlib
+    import matplotlib.pyplot as plt
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.pie(weights, labels=categories, autopct='%1.1f%%')
+    ax.set_title("Coral Health Distribution")
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=200, bbox_inches='tight')
+    # Drop the figure from pyplot's global registry so it can be garbage collected
+    plt.close(fig)
+    return buf.getvalue()
+
+# Keyed on upload bytes, so bound it to keep server memory flat over time
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
+def _thumbnail(image_bytes, max_width=600):
+    """
+    Decode an uploaded image, apply its EXIF orientation and resample it to
+    display width
+    Returns encoded bytes so reruns skip the decode, resample and re-encode
+    """
+    import io
+    from PIL import Image, ImageOps
+    # Apply the EXIF Orientation tag up front; re-encoding would drop it
+    img = ImageOps.exif_transpose(Image.open(io.BytesIO(image_bytes)))
+    # The generous height bound keeps portrait shots at full display width
+    img.thumbnail((max_width, max_width * 4), Image.LANCZOS)
+
+    buf = io.BytesIO()
+    if img.mode in ('RGBA', 'LA', 'P'):
+        img.save(buf, format='PNG')
+    else:
+        img.convert('RGB').save(buf, format='JPEG', quality=90)
+    return buf.getvalue()
+
+def _category_bar_chart(categories, values, title, x_title, y_title):
+    """
+    Bar chart of one value per category, rendered client-side in model order
+    """
+    import altair as alt
+    import pandas as pd
+    data = pd.DataFrame({'Category': categories, 'Value': values})
+    return alt.Chart(data, title=title).mark_bar().encode(
+        x=alt.X('Category:N', sort=None, title=x_title, axis=alt.Axis(labelAngle=-45)),
+        y=alt.Y('Value:Q', title=y_title)
+    )
+
+def _species_health_chart(categories, health_indices, colors):
+    """
+    Color-coded bar chart of species health indices, rendered client-side
+    """
+    import altair as alt
+    import pandas as pd
+    data = pd.DataFrame({'Species': categories, 'Health Score': health_indices, 'Color': colors})
+    base = alt.Chart(data, title="Marine Species Health Index").encode(
+        x=alt.X('Species:N', sort=None, axis=alt.Axis(labelAngle=-30)),
+        y=alt.Y('Health Score:Q', scale=alt.Scale(domain=[0, 1]))
+    )
+    bars = base.mark_bar().encode(color=alt.Color('Color:N', scale=None))
+    # Add value labels on top of bars
+    labels = base.mark_text(baseline='bottom', dy=-2).encode(
+        text=alt.Text('Health Score:Q', format='.2f'))
+    return bars + labels
+
+@st.cache_resource(show_spinner=False)
+def _warmup_kernels():
+    """
+    Load the compiled scoring kernels once per server process
+    """
+    from marine_kernels import warmup
+    warmup()
 
 def main():
     st.set_page_config(
@@ -386,23 +537,7 @@ def main():
         show_about_page()
 
 def show_home_page():
-    st.markdown("""
-    ### 🌊 Protecting Our Oceans Together
-    
-    Marine Ecosystem Guardian is an advanced monitoring and analysis platform designed to help protect our ocean ecosystems. 
-    Our tools provide real-time insights into various marine environmental challenges.
-    
-    #### Key Features:
-    1. 🔍 **Real-time Analysis** of marine environmental conditions
-    2. 📊 **Data Visualization** for better understanding
-    3. 🎯 **Actionable Insights** for conservation
-    4. 🤝 **Community Engagement** in marine protection
-    
-    #### Why It Matters:
-    - Ocean health directly impacts global climate
-    - Marine biodiversity is crucial for ecosystem balance
-    - Human activities significantly affect marine environments
-    """)
+    st.markdown(_HOME_HTML)
 
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -413,8 +548,9 @@ def show_home_page():
         st.success("##### Conservation\nImplement protection measures")
 
 def show_analysis_tools():
-    analyzer = MarineEcosystemAnalyzer()
-    
+    # Only this page reaches the scoring kernels, so only it pays for Numba
+    _warmup_kernels()
+
     # Analysis type selection with descriptions
     st.markdown("### 📊 Select Analysis Type")
     
@@ -431,80 +567,32 @@ def show_analysis_tools():
     )
 
     if analysis_type == "Marine Ecosystem Health":
-        analyzer.analyze_marine_health()
+        analyze_marine_health()
     elif analysis_type in ["Plastic Waste Impact", "Coral Reef Health", "Oil Spill Detection"]:
         uploaded_file = st.file_uploader(f"Upload {analysis_type} Image", type=["jpg", "png", "jpeg"])
         if uploaded_file:
-            st.image(uploaded_file, caption="Uploaded Image", width= 600)
+            st.image(_thumbnail(uploaded_file.getvalue()), caption="Uploaded Image", width=600)
             
-            # Call appropriate analysis method
+            # Call appropriate analysis function
             if analysis_type == "Plastic Waste Impact":
-                analyzer.analyze_plastic_waste(uploaded_file)
+                analyze_plastic_waste(uploaded_file)
             elif analysis_type == "Coral Reef Health":
-                analyzer.analyze_coral_health(uploaded_file)
+                analyze_coral_health(uploaded_file)
             elif analysis_type == "Oil Spill Detection":
-                analyzer.analyze_oil_spill(uploaded_file)
+                analyze_oil_spill(uploaded_file)
     
     elif analysis_type == "Marine Ecosystem Health":
-        analyzer.analyze_marine_health()
+        analyze_marine_health()
 
 def show_prevention_guide():
-    st.markdown("""
-    # 🛡️ Marine Protection Guidelines
-    
-    <style>
-    .main-title {
-        font-size: 32px;
-        color: #ffffff;
-        font-weight: 700;
-        margin-bottom: 30px;
-    }
-    .section-title {
-        font-size: 28px;
-        color: #f0f0f0;
-        font-weight: 600;
-        margin: 25px 0 15px 0;
-    }
-    .subsection-title {
-        font-size: 22px;
-        color: #e0e0e0;
-        font-weight: 500;
-        margin: 20px 0 10px 0;
-    }
-    .list-items {
-        font-size: 18px;
-        color: #d0d0d0;
-        line-height: 2;
-        margin-left: 25px;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(_PREVENTION_HTML, unsafe_allow_html=True)
 
-    # Individual Actions Section
-    st.markdown('<p class="section-title">Individual Actions</p>', unsafe_allow_html=True)
-    
     col1, col2 = st.columns(2)
     with col1:
-        st.markdown('<p class="subsection-title">Daily Habits</p>', unsafe_allow_html=True)
-        st.markdown("""
-        <div class="list-items">
-        • Reduce single-use plastics<br>
-        • Choose sustainable seafood<br>
-        • Use reef-safe sunscreen<br>
-        • Properly dispose of waste
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_DAILY_HABITS_HTML, unsafe_allow_html=True)
     
     with col2:
-        st.markdown('<p class="subsection-title">Active Participation</p>', unsafe_allow_html=True)
-        st.markdown("""
-        <div class="list-items">
-        • Join beach cleanup events<br>
-        • Support marine conservation groups<br>
-        • Report marine pollution incidents<br>
-        • Share awareness on social media
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_ACTIVE_PARTICIPATION_HTML, unsafe_allow_html=True)
 
     # Educational Resources Section
     st.markdown('<p class="section-title">📚 Educational Resources</p>', unsafe_allow_html=True)
@@ -555,19 +643,8 @@ def show_prevention_guide():
     with impact_col3:
         st.metric("Marine Species at Risk", "2,270 species", "↑ 2.8%")
 
-    # Call to Action
-    st.markdown("""
-    <div style="background-color: #f0f8ff; padding: 20px; border-radius: 10px; margin-top: 30px;">
-    <p class="section-title" style="color: #1e90ff;">🎯 Take Action Today</p>
-    <p style="font-size: 18px;">
-    Join the global movement to protect our oceans. Start with small changes in your daily life 
-    and become part of the solution. Remember, every action counts!
-    </p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # Additional Resources
-    st.markdown('<p class="section-title">🔗 Useful Links</p>', unsafe_allow_html=True)
+    # Call to Action and Additional Resources
+    st.markdown(_CALL_TO_ACTION_HTML, unsafe_allow_html=True)
     
     with st.expander("Marine Conservation Organizations"):
         st.markdown("""
@@ -585,23 +662,7 @@ def show_prevention_guide():
         """)
 
 def show_about_page():
-    st.markdown("""
-    ### About Marine Ecosystem Guardian
-    
-    This project combines advanced analytics with environmental science to protect our oceans.
-    
-    #### Technology Stack:
-    - Image Analysis
-    - Real-time Monitoring
-    - Data Visualization
-    - Predictive Analytics
-    
-    #### Future Developments:
-    - Artificial Intelligence Integration
-    - Mobile Application
-    - Community Features
-    - Global Data Integration
-    """)
+    st.markdown(_ABOUT_HTML)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
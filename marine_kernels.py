@@ -0,0 +1,45 @@
+"""
+Numba-compiled scoring kernels used by the analysis tools.
+
+Kept out of app.py so the home and static pages never import Numba. The
+Analysis Tools page calls warmup() on its first visit in each server
+process. With cache=True the compiled code is loaded from disk after the
+first launch.
+"""
+import numpy as np
+from numba import njit, vectorize
+
+
+@njit('f8(f8, f8, f8, f8, f8[::1])', cache=True)
+def hab_risk(water_temp, nutrient_levels, salinity, ph_level, sensitivity):
+    """
+    Harmful algal bloom risk score
+    Sensitivities are ordered temperature, nutrients, salinity, pH
+    """
+    return (sensitivity[0] * (water_temp / 35) +
+            sensitivity[1] * (nutrient_levels / 10) +
+            sensitivity[2] * (1 - abs(salinity - 35) / 10) +
+            sensitivity[3] * (1 - abs(ph_level - 8) / 2))
+
+
+@vectorize(['f8(f8, f8, f8)'], target='cpu', fastmath=True, cache=True)
+def param_score(value, min_val, max_val):
+    """
+    Score of one water quality parameter
+    1.0 inside the optimal range, losing score in proportion to how far the
+    value falls outside it
+    """
+    if value < min_val:
+        return max(0.0, 1 - (min_val - value) / (min_val if min_val != 0 else 1.0))
+    if value > max_val:
+        return max(0.0, 1 - (value - max_val) / (max_val if max_val != 0 else 1.0))
+    return 1.0
+
+
+def warmup():
+    """
+    Load (or compile) every kernel and run it once, so the first user to
+    open a scoring page does not wait on Numba
+    """
+    hab_risk(25.0, 2.0, 35.0, 8.0, np.array([0.3, 0.3, 0.2, 0.2]))
+    param_score(np.array([7.0, 3.0, 5.0, 1.0]), np.zeros(4), np.ones(4))